@@ -11,15 +11,18 @@ from pathlib import Path
 
 # Add repository root to path
 repo_root = Path(__file__).parent.parent
-sys.path.insert(0, str(repo_root))
+if str(repo_root) not in sys.path:
+    sys.path.insert(0, str(repo_root))
 
 
 def run_tests():
     """Run all tests and return the result."""
-    # Discover and run all tests
+    # Build the suite from the known test modules rather than discovering them;
+    # this directory is sys.path[0] when the script is run directly
+    import test_configuration_files
+    
     loader = unittest.TestLoader()
-    start_dir = Path(__file__).parent
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    suite = loader.loadTestsFromModule(test_configuration_files)
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)